@@ -1,6 +1,6 @@
 from typing import Any, Sequence, MutableSequence, NamedTuple, Iterator, cast, Self
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from copy import copy
 from core.signals import Signal
 
@@ -50,6 +50,11 @@ class Cell:
     def __hash__(self):  # implemented to make Cell hashable (so can be used as keys in dict for instance)
         return hash(self.quanta)
 
+    @classmethod
+    def from_string(cls, string: str) -> list[Cell]:
+        """Creates a fresh cell per character. Cells are NOT pooled/interned because each carries its own causal metadata."""
+        return list(map(cls, string))
+
 
 class SpaceState(ABC):
     """Mutable container made up of `Cells` (a.k.a. Universe State of Space).
@@ -119,7 +124,10 @@ class SpaceState1D(SpaceState):
         self.cells: MutableSequence[Cell] = cells
 
     def __str__(self):
-        return ''.join((str(c) for c in self.cells))
+        try:  # the quanta are almost always strings already, so skip the (python level) Cell.__str__ call per cell
+            return ''.join([c.quanta for c in self.cells])
+        except TypeError:
+            return ''.join(map(str, self.cells))
 
     def __repr__(self):
         return str(self)
@@ -151,9 +159,14 @@ class SpaceState1D(SpaceState):
         return self.cells
 
     def find(self, subspace: Sequence[Cell]) -> Iterator[tuple[int, int]]:
+        cells: Sequence[Cell] = self.cells
         subspace_len: int = len(subspace)
-        for i in range(len(self.cells) - subspace_len + 1):  # we use left-to-right search
-            if all(self.cells[i + j] == subspace[j] for j in range(subspace_len) if subspace[j].quanta != '.'):
+        checks: list[tuple[int, Any]] = [(j, c.quanta) for j, c in enumerate(subspace) if c.quanta != '.']  # wildcards are dropped once rather than at every position
+        for i in range(len(cells) - subspace_len + 1):  # we use left-to-right search
+            for j, quanta in checks:
+                if cells[i + j].quanta != quanta:
+                    break
+            else:
                 yield i, i + subspace_len
 
     # ==== Custom Modifiers ====
@@ -170,8 +183,8 @@ class SpaceState1D(SpaceState):
         return DeltaCell((), new)
 
     def overwrite(self, selector: int, new: Sequence[Cell]) -> DeltaCell:
-        destroyed: tuple[Cell, ...] = ()
-        new_: tuple[Cell, ...] = ()  # only here due to "_" being a cursor jump/skip operator
+        destroyed: list[Cell] = []
+        new_: list[Cell] = []  # only here due to "_" being a cursor jump/skip operator
         if selector < 0:
             selector = len(self.cells) + selector
         for i in range(len(new)):
@@ -180,12 +193,12 @@ class SpaceState1D(SpaceState):
             if new_char.quanta == '_':  # skip these
                 continue
             try:
-                destroyed += (self.cells[idx],)
+                destroyed.append(self.cells[idx])
                 self.cells[idx] = new_char
             except IndexError:
                 self.cells.append(new_char)
-            new_ += (new_char,)
-        return DeltaCell(destroyed, new_)
+            new_.append(new_char)
+        return DeltaCell(tuple(destroyed), tuple(new_))
 
     def delete(self, selector: tuple[int, int]) -> DeltaCell:
         start, end = selector
@@ -361,6 +374,7 @@ class Event:
     inert: bool = False  # if true, the new event caused no changes to the system.
     weight: int | float = 1  # could be used for weighted causality tracking. (think of it as a time multiplier/dilator)
     causal_distance_to_creation: int = 0  # minimum distance (min number of nodes) to the creation event node.
+    _causally_connected_events: tuple[int, ...] | None = field(default=None, init=False, repr=False, compare=False)  # cache
 
     @property  # maybe cache this?
     def affected_cells(self) -> Iterator[DeltaCell]:
@@ -371,12 +385,15 @@ class Event:
                     if cell_delta:
                         yield cell_delta
 
-    @property  # maybe cache this?
-    def causally_connected_events(self) -> Iterator[int]:
+    @property
+    def causally_connected_events(self) -> tuple[int, ...]:
         """Returns events (stored as indices) whose created cells were destroyed by this event"""
-        for delta in self.affected_cells:
-            for cell in delta.destroyed_cells:
-                yield cell.created_at
+        # cached on first access: the destroyed cells were created by earlier events, so their `created_at` never changes.
+        if self._causally_connected_events is None:
+            self._causally_connected_events = tuple(
+                cell.created_at for delta in self.affected_cells for cell in delta.destroyed_cells
+            )
+        return self._causally_connected_events
 
     @property  # maybe cache this?
     def spaces(self) -> Iterator[SpaceState]:
@@ -421,7 +438,7 @@ class Flow:
     def set_ruleset(self, ruleset: RuleSet) -> None:
         """Used to set the rule set"""
         self.ruleset: RuleSet = ruleset
-        self.on_ruleset_set.emit(self)
+        self.on_ruleset_set.emit1(self)
 
     def set_initial_space(self, initial_space: Sequence[SpaceState]) -> None:
         """Used to set the initial space"""
@@ -435,7 +452,7 @@ class Flow:
     def clear_evolution(self) -> None:
         """Clear the evolution."""
         del self.events[1:]
-        self.on_clear.emit(self)
+        self.on_clear.emit1(self)
 
     @property
     def current_event(self) -> Event:
@@ -466,7 +483,9 @@ class Flow:
         )
 
         # process causality
+        current_event: Event = self.current_event
         current_event_idx: int = self.current_event_idx
+        destroyed: list[Cell] = []
         for ar in applied_rules:
             for sd in ar.space_deltas:
                 for dc in sd.cell_deltas:
@@ -474,15 +493,18 @@ class Flow:
                         cell.created_at = current_event_idx
                     for cell in dc.destroyed_cells:
                         cell.destroyed_at += (current_event_idx,)  # first one, of course, will be the main lineage
+                    destroyed.extend(dc.destroyed_cells)
+        # fill the causally connected events cache in the same pass (rather than walking all the deltas again)
+        current_event._causally_connected_events = tuple(cell.created_at for cell in destroyed)
 
         # process causal distance to creation
         min_prev: int = min((self.events[e_idx].causal_distance_to_creation
-                             for e_idx in self.current_event.causally_connected_events),
+                             for e_idx in current_event.causally_connected_events),
                             default=-1)
-        self.current_event.causal_distance_to_creation = min_prev + 1
+        current_event.causal_distance_to_creation = min_prev + 1
 
         # emit any signals
-        self.on_evolved_step.emit(self)
+        self.on_evolved_step.emit1(self)
 
     def evolve(self, n_steps: int, break_when_inert: bool = False) -> None:
         """Evolve the system n steps."""
@@ -510,7 +532,7 @@ class Flow:
         self.events.pop()
 
         # emit any signals
-        self.on_undone_step.emit(self)
+        self.on_undone_step.emit1(self)
 
     def undo(self, n_steps: int) -> None:
         for _ in range(n_steps):
@@ -8,6 +8,7 @@ TODO:
 - Add more tools for seamless analysis and integrations.
 """
 from core.engine import Flow
+from core.numlib import as_index
 from networkx import MultiDiGraph
 from typing import Sequence, Self
 
@@ -18,16 +19,22 @@ class EventCausalityGraph(MultiDiGraph):
                  collapse_multi_edges: bool = False) -> Self:
         # construct causal graph - because each node is literally the time, and thus index, it can be used to query to the actual event for more granular information.
         connected_container: type[tuple] | type[set] = set if collapse_multi_edges else tuple
-        for event in flow.events[event_range[0]:event_range[1]+1:event_range[2]]:
+        nodes: list[tuple[int, dict[str, str]]] = []
+        edges: list[tuple[int, int]] = []
+        for event in flow.events[event_range[0]:as_index(event_range[1]+1):event_range[2]]:
             causally_connected: Sequence[int] = connected_container(event.causally_connected_events)
-            self.add_node(
+            nodes.append((
                 event.time,
                 # these get passed on to the nodes of VisJS network.
-                label=f'{event.time}',
-                title=f' Causal Distance: {event.causal_distance_to_creation}\n'
-                      f'Connected Events: {len(causally_connected)}',
-                shape='box'
-            )
-            for parent_time in causally_connected:
-                self.add_edge(parent_time, event.time)
+                {
+                    'label': f'{event.time}',
+                    'title': f' Causal Distance: {event.causal_distance_to_creation}\n'
+                             f'Connected Events: {len(causally_connected)}',
+                    'shape': 'box'
+                }
+            ))
+            edges.extend([(parent_time, event.time) for parent_time in causally_connected])
+        # add everything in bulk (rather than one add_node()/add_edge() call at a time)
+        self.add_nodes_from(nodes)
+        self.add_edges_from(edges)
         return self
@@ -18,27 +18,41 @@ class Signal[*T]:
     prefix or suffix the signal names when defining them in both the instance and class spaces. Alternatively, you
     could also pass `self` when emitting and let the client decide what to do based on that.
     """
-    __slots__ = ('callables',)
+    __slots__ = ('callables', '_connected')
 
     def __init__(self) -> None:
-        self.callables: list[tuple[Callable[[*T], Any], int]] = []
+        self.callables: tuple[tuple[Callable[[*T], Any], int], ...] = ()  # immutable: rebuilt on (dis)connect, iterated on every emit
+        self._connected: set[Callable[..., Any]] = set()  # O(1) membership check for connect()
 
     @property
     def callables_count(self) -> int:
         return len(self.callables)
 
     def emit(self, *args: *T) -> None:
+        if not self.callables:
+            return
         for c, arg_len in self.callables:
             c(*args[:arg_len])
 
+    def emit1(self, a: Any) -> None:
+        """Fast path of emit() for signals that carry exactly one argument (no argument packing/slicing per callable)."""
+        if not self.callables:
+            return
+        for c, arg_len in self.callables:
+            if arg_len:
+                c(a)
+            else:
+                c()
+
     def connect(self, c: Callable[..., Any]) -> None:
-        if c not in self.callables:
-            self.callables.append((c, len(signature(c).parameters)))
+        if c not in self._connected:
+            self._connected.add(c)
+            self.callables += ((c, len(signature(c).parameters)),)
 
     def disconnect(self, c: Callable[..., Any]) -> None:
-        matches: list[int] = [i for i, (c_, _) in enumerate(self.callables) if c_ is c]
-        for i in reversed(matches):
-            self.callables.pop(i)
+        if c in self._connected:
+            self._connected.discard(c)
+            self.callables = tuple(pair for pair in self.callables if pair[0] != c)  # == so that (ephemeral) bound methods match
 
 
 if __name__ == "__main__":
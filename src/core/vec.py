@@ -65,6 +65,15 @@ class NullByteArray(bytearray):
         return "<NullByteArray>"
 
 
+# ================================ Search Buffer Encoding ================================
+def _quanta_string(cells: Sequence[Cell]) -> str:
+    """Joins the quanta of the cells so that it can be encoded to the search buffer in one C-level step (rather than one ord() per cell)."""
+    s: str = ''.join([c.quanta for c in cells])
+    if len(s) != len(cells):  # otherwise the buffer indices would no longer line up with the cells
+        raise TypeError('Every cell quanta must be a single character to be encoded in the search buffer.')
+    return s
+
+
 # ================================ Target Bytes Cache ================================
 # IMPORTANT NOTE: Sequence[Cell] must really be tuple[Cell] for there to be any benefit to using the Cache!!! Because tuple is hashable.
 _bytes_cache_size: int = 1024
@@ -89,13 +98,13 @@ def enable_bytes_cache(b: bool, cache_size: int = _bytes_cache_size):
                         del _bytes_cache[next(iter(_bytes_cache))]  # use the fact that dicts keep element order to follow FIFO caching principles
                     except (StopIteration, RuntimeError, KeyError):
                         pass
-                _bytes_cache[key] = (r := bytes(ord(c.quanta) for c in key))
+                _bytes_cache[key] = (r := _quanta_string(key).encode('latin-1'))
                 return r
             except TypeError:  # if key is not hashable:  # but it really-really ought to be!
                 return retrieve_bytes(tuple(key))
     else:
         def retrieve_bytes(key: Sequence[Cell]) -> bytes:
-            return bytes(ord(c.quanta) for c in key)
+            return _quanta_string(key).encode('latin-1')
     globals()['_retrieve_bytes'] = retrieve_bytes
 enable_bytes_cache(True)
 _search_buffer_enabled: bool = True
@@ -111,12 +120,21 @@ def enable_search_buffer(b: bool):
 import re
 import regex
 from regex import compile  # the default regex compiler
-def set_regex_backend(m: Literal['re', 'regex']):
-    """Set the regex backend to either the builtin `re` or the more versatile `regex` (default)"""
+try:  # optional linear-time (automaton based, no backtracking) backend
+    import re2
+except ImportError:
+    re2 = None
+def set_regex_backend(m: Literal['re', 'regex', 're2']):
+    """Set the regex backend to either the builtin `re`, the more versatile `regex` (default), or `re2` (optional `google-re2` package).
+    `re2` matches in linear time, which pays off for large rule sets with many selectors, but it does not support backreferences or lookarounds."""
     if m == 'regex':
         globals()['compile'] = regex.compile
     elif m == 're':
         globals()['compile'] = re.compile
+    elif m == 're2':
+        if re2 is None:
+            raise ImportError("The 're2' regex backend requires the optional `google-re2` package.")
+        globals()['compile'] = re2.compile
 def set_regex_compiler_args(*args, **kwargs):
     """Sets the default args for the regex compiler that compiles patterns."""
     global _regex_compiler_args
@@ -158,18 +176,40 @@ def enable_pattern_cache(b: bool, cache_size: int = _pattern_cache_size):
             return compile(p, *_regex_compiler_args[0], **_regex_compiler_args[1])
     globals()['_retrieve_pattern'] = retrieve_pattern
 enable_pattern_cache(True)
-def finditer(pattern: str | bytes, search_buffer: bytearray) -> Iterator[re.Match | regex.Match]:
-    return _retrieve_pattern(pattern).finditer(search_buffer, *_regex_find_args[0], **_regex_find_args[1])
+class LiteralPattern(bytes):
+    """A precompiled pattern without any regex syntax. Vec.finditer() scans for it with bytes.find() rather than the regex engine."""
+type CompiledPattern = re.Pattern | regex.Pattern | LiteralPattern  # anything precompile() can return
+_REGEX_SYNTAX: bytes = b'\\.^$*+?{}[]|()'
+def precompile(p: str | bytes) -> CompiledPattern:
+    """Compiles (through the pattern cache) a pattern ahead of time so that it can be passed directly to finditer()."""
+    b: bytes = bytes(p, _pattern_encoding) if isinstance(p, str) else p
+    if b and not (_regex_compiler_args[0] or _regex_compiler_args[1]) and len(b.translate(None, _REGEX_SYNTAX)) == len(b):
+        return LiteralPattern(b)
+    return _retrieve_pattern(p)
+def finditer(pattern: str | bytes | re.Pattern | regex.Pattern, search_buffer: bytearray) -> Iterator[re.Match | regex.Match]:
+    if isinstance(pattern, (str, bytes)):  # otherwise it is already compiled
+        pattern = _retrieve_pattern(pattern)
+    return pattern.finditer(search_buffer, *_regex_find_args[0], **_regex_find_args[1])
 
 
 
 # ================================ Vector Implementation ================================
 class Vec(MutableSequence):
-    __slots__ = ('vec', 'search_buffer')
+    __slots__ = ('vec', 'search_buffer', '_buf_shared')
 
     def __init__(self, elems: Sequence[Cell]):
         self.vec: MutableSequence[Cell] = elems if isinstance(elems, MutableSequence) else list(elems)
-        self.search_buffer: bytearray = bytearray((ord(c.quanta) for c in elems))
+        self.search_buffer: bytearray = bytearray(_quanta_string(elems), 'latin-1')
+        self._buf_shared: bool = False  # True while the search buffer may still be shared with a branch (copy-on-write)
+
+    @classmethod
+    def from_string(cls, string: str) -> Vec:
+        """Builds a vector of fresh cells from a string (the search buffer is encoded in one step rather than cell by cell)."""
+        nv: Vec = object.__new__(cls)
+        nv.vec = Cell.from_string(string)
+        nv.search_buffer = bytearray(string, 'latin-1')
+        nv._buf_shared = False
+        return nv
 
     def __str__(self):
         return str(self.vec)
@@ -189,7 +229,8 @@ class Vec(MutableSequence):
         """Branch the current vector into a new vector"""
         nv: Vec = object.__new__(Vec)
         nv.vec = copy(self.vec)
-        nv.search_buffer = self.search_buffer  # note: becomes out-of-date on self after branch
+        nv.search_buffer = self.search_buffer  # shared until either side writes to it (copy-on-write)
+        nv._buf_shared = self._buf_shared = True
         return nv
 
     def __copy__(self):
@@ -199,8 +240,14 @@ class Vec(MutableSequence):
         return self.branch()
 
     def refresh_search_buffer(self):
-        """Must be called if you want to refresh a dirty search buffer."""
-        self.search_buffer = bytearray((ord(c.quanta) for c in self.vec))
+        """Rebuilds the search buffer from the cells (only needed if the buffer was edited directly)."""
+        self.search_buffer = bytearray(_quanta_string(self.vec), 'latin-1')
+        self._buf_shared = False
+
+    def _own_search_buffer(self):
+        """Gives this vector its own copy of a search buffer that is shared with a branch (called before the first write to it)."""
+        self.search_buffer = bytearray(self.search_buffer)
+        self._buf_shared = False
 
     # ================ Viewer Methods ================
     def __len__(self):
@@ -220,13 +267,22 @@ class Vec(MutableSequence):
         self.commit()  # flush any changes before getting anything...
         return self.vec[index]
 
-    def finditer(self, pattern: str | bytes, group: int = 0) -> Iterator[tuple[int, int]]:
+    def finditer(self, pattern: str | bytes | CompiledPattern, group: int = 0) -> Iterator[tuple[int, int]]:
         # group tells span to return for a specific (sub)group within the regex match. 0 is the default and returns the span for the entire match.
         if not _search_buffer_enabled:
             self.commit()  # flush any changes
-            buffer = _bytearray((ord(c.quanta) for c in self.vec))  # is bytearray when search buffer is disabled.
+            buffer = _bytearray(_quanta_string(self.vec), 'latin-1')  # is bytearray when search buffer is disabled.
         else:
             buffer = self.search_buffer
+        if type(pattern) is LiteralPattern and not (_regex_find_args[0] or _regex_find_args[1]):
+            # leftmost non-overlapping occurrences, the same spans the regex engine would give (but without the Match objects)
+            find = buffer.find
+            n: int = len(pattern)
+            i: int = find(pattern)
+            while i != -1:
+                yield i, i + n
+                i = find(pattern, i + n)
+            return
         for m in finditer(pattern, buffer):
             yield m.span(group)
 
@@ -240,25 +296,35 @@ class Vec(MutableSequence):
         ...
 
     def __setitem__(self, index, value):
+        if self._buf_shared:
+            self._own_search_buffer()
         self.vec[index] = value
         self.search_buffer[index] = ord(value.quanta) if isinstance(value, Cell) else _retrieve_bytes(value)
 
     def __delitem__(self, index: int | slice):
+        if self._buf_shared:
+            self._own_search_buffer()
         del self.vec[index]
         del self.search_buffer[index]
 
     def append(self, value: Cell):
         """Append value to end"""
+        if self._buf_shared:
+            self._own_search_buffer()
         self.vec.append(value)
         self.search_buffer.append(ord(value.quanta))
 
     def extend(self, values: Sequence[Cell]):
         """Extend with values"""
+        if self._buf_shared:
+            self._own_search_buffer()
         self.vec.extend(values)
         self.search_buffer.extend(_retrieve_bytes(values))
 
     def insert(self, index: int, value: Cell):
         """Insert value at index"""
+        if self._buf_shared:
+            self._own_search_buffer()
         self.vec.insert(index, value)
         self.search_buffer.insert(index, ord(value.quanta))
 
@@ -269,9 +335,20 @@ class TrieVec(Vec):
     def __init__(self, elems: Sequence[Cell]):
         object.__init__(super())
         self.vec: PVector[Cell] = pvector(elems)
-        self.search_buffer: bytearray = bytearray((ord(c.quanta) for c in elems))
+        self.search_buffer: bytearray = bytearray(_quanta_string(elems), 'latin-1')
+        self._buf_shared: bool = False
         self.evolver: PVectorEvolver[Cell] | None = None
 
+    @classmethod
+    def from_string(cls, string: str) -> TrieVec:
+        """Builds a vector of fresh cells from a string (the search buffer is encoded in one step rather than cell by cell)."""
+        nv: TrieVec = object.__new__(cls)
+        nv.vec = pvector(Cell.from_string(string))
+        nv.search_buffer = bytearray(string, 'latin-1')
+        nv._buf_shared = False
+        nv.evolver = None
+        return nv
+
     def __str__(self):
         return 'Vec' + str(self.vec)[7:]
 
@@ -292,7 +369,8 @@ class TrieVec(Vec):
         nv: TrieVec = object.__new__(TrieVec)
         nv.vec = self.vec  # we don't need to copy as edit() will do that for us
         nv.evolver = None
-        nv.search_buffer = self.search_buffer  # note: becomes dirty on self after branch
+        nv.search_buffer = self.search_buffer  # shared until either side writes to it (copy-on-write)
+        nv._buf_shared = self._buf_shared = True
         # we could auto enter edit mode here... however, that is not necessary as this should work just fine because it is auto entered upon edits.
         return nv
 
@@ -304,6 +382,14 @@ class TrieVec(Vec):
     def __setitem__(self, index: slice, value: Sequence[Cell]) -> None: ...
 
     def __setitem__(self, index, value):
+        if self._buf_shared:
+            self._own_search_buffer()
+        if type(index) is int:  # point update (the common case): skips the slice handling and the edit() call
+            if self.evolver is None:
+                self.evolver = self.vec.evolver()
+            self.evolver[index] = value
+            self.search_buffer[index] = ord(value.quanta)
+            return
         if isinstance(index, slice):
             value: Sequence[Cell]
             start, stop, _ = index.indices(len(self.vec))
@@ -316,7 +402,7 @@ class TrieVec(Vec):
                 self.vec = self.vec[:start] + pvector(value) + self.vec[stop:]  # does not use the Evolver object as this creates a new node.
             self.search_buffer[index] = _retrieve_bytes(value)
             return
-        # if isinstance(index, int):
+        # other integer-like indices (e.g. numpy ints)
         value: Cell
         self.edit()
         self.evolver[index] = value
@@ -330,12 +416,16 @@ class TrieVec(Vec):
 
     def append(self, value: Cell):
         """Append value to end"""
+        if self._buf_shared:
+            self._own_search_buffer()
         self.edit()
         self.evolver.append(value)
         self.search_buffer.append(ord(value.quanta))
 
     def extend(self, values: Sequence[Cell]):
         """Extend with values"""
+        if self._buf_shared:
+            self._own_search_buffer()
         self.edit()
         self.evolver.extend(values)
         self.search_buffer.extend(_retrieve_bytes(values))
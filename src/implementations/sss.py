@@ -1,6 +1,8 @@
 """Sequential Substitution System"""
+import re
 from typing import Sequence, cast
-from copy import deepcopy, copy
+from collections import deque
+from copy import copy
 from core.engine import (
     Flow,
     SpaceState1D as SpaceState,
@@ -8,37 +10,163 @@ from core.engine import (
     Rule as RuleABC,
     RuleMatch,
     RuleSet,
-    DeltaSpace
+    DeltaSpace,
+    DeltaSpaces
 )
+from core.vec import Vec
+
+
+_RULE_RE: re.Pattern = re.compile(r'\s*(\S*)\s+(->)\s+(\S*)\s*')  # selector -> target (either side may be empty)
 
 
 class ReplacementRule(RuleABC):
     def __init__(self, rule_str: str):
         RuleABC.__init__(self)
-        selector, op, target = rule_str.split(' ')
-        self.selector_cells = tuple(Cell(c) for c in selector.strip())
-        self.target_cells = tuple(Cell(c) for c in target.strip())
+        if (m := _RULE_RE.fullmatch(rule_str)) is None:
+            raise ValueError(f"Invalid rule '{rule_str}', expected 'selector -> target'.")
+        selector, op, target = m.groups()
+        self.selector_cells = tuple(map(Cell, selector))
+        self.target_cells = tuple(map(Cell, target))
+        self.selector_key: bytes | None = None  # for bytes.find() on the search buffer (wildcards and non latin-1 selectors need the generic find)
+        if '.' not in selector:
+            try:
+                self.selector_key = bytes(selector, 'latin-1')
+            except UnicodeEncodeError:
+                pass
         self.group_break = True  # set flags to modify the RuleSet behavior
 
     def match(self, spaces: Sequence[SpaceState]) -> Sequence[RuleMatch]:
-        output = ()
-        if matches:=next(spaces[0].find(self.selector_cells), None):
-            output += (RuleMatch(space=spaces[0], matches=(matches,), conflicts=set()),)
-        return output
+        buffer = getattr(spaces[0].cells, 'search_buffer', None)
+        if self.selector_key is not None and type(buffer) is bytearray:  # the search buffer may be disabled
+            if (i := buffer.find(self.selector_key)) != -1:
+                return (RuleMatch(space=spaces[0], matches=((i, i + len(self.selector_key)),), conflicts=set()),)
+        elif matches:=next(spaces[0].find(self.selector_cells), None):  # only the first match is used (sequential)
+            return (RuleMatch(space=spaces[0], matches=(matches,), conflicts=set()),)
+        return ()
 
     def apply(self, rule_matches: Sequence[RuleMatch]) -> Sequence[DeltaSpace]:
         selector: tuple[int, int] = rule_matches[0].matches[0]
         old_space: SpaceState = cast(SpaceState, rule_matches[0].space)  # we cast to satisfy the type checker
         new_space: SpaceState = copy(old_space)
-        cell_deltas = new_space.substitute(selector, deepcopy(self.target_cells))
+        cell_deltas = new_space.substitute(selector, tuple(map(Cell.__copy__, self.target_cells)))  # fresh cells (their causal metadata gets set) without the deepcopy machinery
         return (DeltaSpace(old_space, (new_space,), (cell_deltas,)),)
 
 
+class SequentialRuleSet(RuleSet):
+    """Finds the first rule that matches (in rule order) with a single Aho-Corasick scan of the space rather than one scan per rule.
+    The scan runs over the packed byte codes of the cells (the Vec search buffer) rather than the Cell objects themselves.
+
+    Only one rule fires per step, so most of the space is unchanged between steps. The prefix in which no selector ends is remembered
+    for the space that was produced, and the next scan resumes just before it ends (or before the last edit, whichever comes first).
+
+    Falls back to the default RuleSet.apply() if any selector uses the '.' wildcard.
+    The automaton is rebuilt if `rules` is changed after construction.
+    """
+
+    def __init__(self, rules: list[ReplacementRule]):
+        super().__init__(rules)
+        self._build()
+
+    def _build(self):
+        """(Re)builds the automaton over the selectors of the current rules."""
+        rules: list[ReplacementRule] = cast(list[ReplacementRule], self.rules)
+        self._built_for: tuple[ReplacementRule, ...] = tuple(rules)
+        self._lengths: tuple[int, ...] = tuple(len(r.selector_cells) for r in rules)
+        self._max_length: int = max(max(self._lengths, default=0), 1)
+        self._resume: tuple[SpaceState, int] | None = None  # (space, position the scan of that space can start at)
+        self._goto: list[dict[int, int]] = [{}]  # state -> {quanta code: next state}
+        self._fail: list[int] = [0]  # state -> failure state
+        self._out: list[tuple[int, ...]] = [()]  # state -> indices of the rules whose selector ends at that state
+        self._automaton: bool = not any(c.quanta == '.' for r in rules for c in r.selector_cells)
+        if not self._automaton:
+            return
+        goto, fail, out = self._goto, self._fail, self._out
+        for idx, rule in enumerate(rules):  # build the trie (goto function)
+            state: int = 0
+            for c in rule.selector_cells:
+                code: int = ord(c.quanta)
+                nxt: int | None = goto[state].get(code)
+                if nxt is None:
+                    goto.append({})
+                    fail.append(0)
+                    out.append(())
+                    nxt = goto[state][code] = len(goto) - 1
+                state = nxt
+            out[state] += (idx,)
+        queue: deque[int] = deque(goto[0].values())  # the failure links (breadth first, depth 1 states fail to the root)
+        while queue:
+            state = queue.popleft()
+            for code, nxt in goto[state].items():
+                queue.append(nxt)
+                f: int = fail[state]
+                while f and code not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(code, 0)
+                out[nxt] += out[fail[nxt]]
+
+    def apply(self, to_spaces: Sequence[SpaceState]) -> list[DeltaSpaces]:
+        if tuple(self.rules) != self._built_for:  # the rules were changed
+            self._build()
+        if not self._automaton:
+            return super().apply(to_spaces)
+        rules: list[ReplacementRule] = cast(list[ReplacementRule], self.rules)
+        first: int | None = next((i for i, r in enumerate(rules) if not r.disabled), None)
+        if first is None:
+            return []
+        goto, fail, out, lengths = self._goto, self._fail, self._out, self._lengths
+        space: SpaceState = to_spaces[0]
+        best: int = len(rules)  # index of the highest priority rule matched so far
+        span: tuple[int, int] = (0, 0)
+        clean: int | None = None  # no selector (of any rule, even disabled ones) ends within space[:clean]
+        for idx in out[0]:  # empty selectors match at the very start
+            clean = 0
+            if idx < best and not rules[idx].disabled:
+                best = idx
+        if best != first:
+            cells: Sequence[Cell] = space.cells
+            buffer: Sequence[int] | None = getattr(cells, 'search_buffer', None)
+            if type(buffer) is not bytearray:  # the search buffer may be disabled
+                buffer = [ord(c.quanta) for c in cells]
+            start: int = self._resume[1] if self._resume is not None and self._resume[0] is space else 0
+            state: int = 0
+            for i in range(start, len(buffer)):
+                code: int = buffer[i]
+                while state and code not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(code, 0)
+                if out[state]:
+                    if clean is None:
+                        clean = i
+                    for idx in out[state]:
+                        if idx < best and not rules[idx].disabled:  # the first time a rule is seen is also its leftmost match
+                            best = idx
+                            span = (i + 1 - lengths[idx], i + 1)
+                    if best == first:  # no other rule can take priority
+                        break
+            if clean is None:
+                clean = len(buffer)
+        if best == len(rules):
+            self._resume = (space, max(0, clean + 1 - self._max_length))
+            return []
+        rule: ReplacementRule = rules[best]
+        space_deltas: Sequence[DeltaSpace] = rule.apply((RuleMatch(space=space, matches=(span,), conflicts=set()),))
+        # the edited space is unchanged (so still clean) up to the start of the edit
+        self._resume = (space_deltas[0].output_space[0], max(0, min(clean, span[0]) + 1 - self._max_length))
+        return [DeltaSpaces(space_deltas, rule)]
+
+
 class SSS(Flow):
-    def __init__(self, rule_set: list[str], initial_space: str):
+    def __init__(self, rule_set: list[str], initial_space: str, mem: type[Vec] = Vec):
+        """`mem` is the vector used for the space (the same as the @mem directive in FlowLang), e.g. TrieVec to share structure between branched spaces.
+        The byte search buffer of `mem` can only hold latin-1, so for any other alphabet the space is a plain list of cells (and the rules scan the cells instead)."""
         super().__init__()
-        self.set_initial_space([SpaceState([Cell(s) for s in initial_space])])
-        self.set_ruleset(RuleSet([ReplacementRule(s) for s in rule_set]))
+        try:  # the rules write their target characters into the space, so they must be encodable as well
+            ''.join((initial_space, *rule_set)).encode('latin-1')
+            cells: Sequence[Cell] = mem.from_string(initial_space)
+        except UnicodeEncodeError:
+            cells = Cell.from_string(initial_space)
+        self.set_initial_space([SpaceState(cells)])
+        self.set_ruleset(SequentialRuleSet([ReplacementRule(s) for s in rule_set]))
 
 
 if __name__ == "__main__":
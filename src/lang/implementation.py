@@ -1,18 +1,18 @@
 """The implementation for 1D space that supports the language features.
 
 Policy:
-- Any multi-ways should have the search_buffer optimization disabled (Vec.enable_search_buffer(False)) so that it doesn't
-become corrupt when branching (one state spawning two states). We have considered coding buffer branching logic...
-however, that does not cover everything as Engine.RuleSet.apply() with group_break=False will not branch the buffer (forgot why).
-In the future, we may consider making the search_buffer branch-able (really, it is already possible by manually using Vec.search_buffer.copy()).
+- Spaces must be branched with copy() (never by sharing the Vec) before being modified. The Vec search_buffer is shared
+copy-on-write between branches, so multi-ways can keep the search_buffer optimization enabled.
 
 Future Considerations:
 - We will need to create different implementations for higher dimensions spaces.
 """
 from typing import Sequence, NamedTuple, Literal, cast, Iterator, Self
-from copy import deepcopy, copy
+from copy import copy
+from random import Random
 from core.numlib import INF
 from core.signals import Signal
+from core.vec import CompiledPattern
 from core.engine import (
     SpaceState1D as SpaceState,
     Cell,
@@ -26,6 +26,7 @@ from core.engine import (
 class Selector(NamedTuple):
     type: Literal["literal", "regex", "range"]
     selector: str | bytes | tuple[int, int]  # str | bytes is used for both literal and regex
+    compiled: CompiledPattern | None = None  # the precompiled pattern of a literal/regex selector (a LiteralPattern when it has no regex syntax)
 
 
 class Target(NamedTuple):
@@ -98,11 +99,12 @@ class BaseRule(RuleABC):
         # rule life flags
         self.lifespan: int = INF  # how many times this rule is allowed to be successfully applied. This is the overall effect a rule can have before it dies.
 
-        # stochastic flags  TODO: implement these
+        # stochastic flags  TODO: implement p_match and p_space
         self.p_seed: int | None = None  # determines the seed... if the outcome will be the same every time.
         self.p_match: int | None = None  # probability that a match will be counted.
         self.p_space: int | None = None  # probability that a space will be selected.
-        self.p_apply: int | None = None  # probability that a rule will apply() at all.
+        self.p_apply: float | None = None  # probability that a rule will apply() at all.
+        self._rng: Random | None = None  # created (with p_seed) on first use because flags are set after __init__
 
         # Note that additional flags can be set in the syntax, however, they will have no meaning unless included in the control flow by subclassing and modifying particular rule.
 
@@ -149,7 +151,7 @@ class BaseRule(RuleABC):
                     if pattern.type in ('literal', 'regex'):
                         # finds = space.find(tuple(Cell(c) for c in pattern.selector))  # older slow way (before Vec containers)
                         # noinspection PyUnresolvedReferences
-                        finds = space.cells.finditer(pattern.selector)  # FlowLang uses the Vec objects from the custom vec implementation for cells in the space states (look at the interpreter). These Vecs have builtin regex matching.
+                        finds = space.cells.finditer(pattern.compiled or pattern.selector)  # FlowLang uses the Vec objects from the custom vec implementation for cells in the space states (look at the interpreter). These Vecs have builtin regex matching.
                     elif pattern.type == 'range':
                         finds = iter((pattern.selector,))
                     else: continue
@@ -188,10 +190,15 @@ class BaseRule(RuleABC):
         return DeltaCell(destroyed_cells, new_cells)
 
     def _call_space_modifier(self, space: SpaceState, selector: tuple[int, int], target: Sequence[Cell] | int | None) -> DeltaCell:
-        raise NotImplementedError('A subclass must implement the correct modifier (e.g. `space.substitute(selector, deepcopy(target))`)')
+        raise NotImplementedError('A subclass must implement the correct modifier (e.g. `space.substitute(selector, tuple(map(Cell.__copy__, target)))`)')
 
     # noinspection PyMethodFirstArgAssignment
     def apply(self, rule_matches: Sequence[RuleMatch]) -> Sequence[DeltaSpace]:
+        if self.p_apply is not None:  # decided before any work (space copies, target copies) is done
+            if self._rng is None:
+                self._rng = Random(self.p_seed)
+            if self._rng.random() >= self.p_apply:
+                return []
         top_self: BaseRule = self  # because self is reassigned when self has a chain of followers.
         modified_spaces: list[DeltaSpace] = []
         for rule_match in rule_matches:  # basically loop through all spaces
@@ -253,6 +260,8 @@ class BaseRule(RuleABC):
                     self.on_execution.emit(self, rule_match, idx)
 
                     # set the new current space (branch into another universe)
+                    if idx == matches_bound:
+                        break  # no matches are left to apply to a new branch, so don't make (copy) one
                     if bl != self.branch_limit:
                         current_space = copy(prev_space) if self.branch_origin == 'prev' else copy(current_space)  # note: be careful when using branch_origin=current because of overwriting a conflict pair... just use with caution.
                         bl += 1
@@ -278,17 +287,17 @@ class BaseRule(RuleABC):
 
 class SubstitutionRule(BaseRule):
     def _call_space_modifier(self, space: SpaceState, selector: tuple[int, int], target: Sequence[Cell]) -> DeltaCell:
-        return space.substitute(selector, deepcopy(target))
+        return space.substitute(selector, tuple(map(Cell.__copy__, target)))
 
 
 class InsertionRule(BaseRule):
     def _call_space_modifier(self, space: SpaceState, selector: tuple[int, int], target: Sequence[Cell]) -> DeltaCell:
-        return space.insert(selector[0], deepcopy(target))
+        return space.insert(selector[0], tuple(map(Cell.__copy__, target)))
 
 
 class OverwriteRule(BaseRule):
     def _call_space_modifier(self, space: SpaceState, selector: tuple[int, int], target: Sequence[Cell]) -> DeltaCell:
-        return space.overwrite(selector[0], deepcopy(target))
+        return space.overwrite(selector[0], tuple(map(Cell.__copy__, target)))
 
 
 class DeletionRule(BaseRule):
@@ -1,14 +1,16 @@
 """
 ==== FUTURE CONSIDERATIONS ====
-- For the 'init' directive, maybe use a save eval such as evalidate rather than the current eval().
+- For the 'init' directive, maybe use a save eval such as evalidate rather than the current eval() (literals no longer go through eval()).
 """
+from ast import literal_eval
 from typing import Any, Type, Iterator, Sequence, Callable, cast
 type SpecialSelector = Callable[[Any], str]
 
 # Import the base engine classes
 from core.engine import Cell, Flow, RuleSet, SpaceState1D as SpaceState
 from core import vec
-from lang.parser import FlowLangParser
+from core.numlib import as_index
+from lang.parser import FlowLangParser, Instruction, Term
 from lang.implementation import (
     Selector, Target, BaseRule, SubstitutionRule, InsertionRule, OverwriteRule,
     DeletionRule, ShiftingRule, ReverseRule
@@ -26,69 +28,82 @@ RULE_MAPPER: dict[str, Type[BaseRule]] = {
 }
 
 
-def interpret_selector(selector_data: dict[str, Any], caller_selector: SpecialSelector | None = None) -> Selector:
+def interpret_selector(selector_data: Term, caller_selector: SpecialSelector | None = None) -> Selector:
     """Converts AST selector data into a clean Selector NamedTuple."""
-    s_type = selector_data["selector_type"]
-    s_value = selector_data["value"]
+    s_type, s_value = selector_data
     if s_type == "literal":
-        return Selector(type=s_type, selector=s_value.replace('_', '.'))  # replace '_' with the regex wildcard '.' because we use regex for matching literals as well.
+        s_value = s_value.replace('_', '.')  # replace '_' with the regex wildcard '.' because we use regex for matching literals as well.
+        return Selector(type=s_type, selector=s_value, compiled=vec.precompile(s_value))
     elif s_type == "regex":
-        return Selector(type=s_type, selector=s_value)
+        return Selector(type=s_type, selector=s_value, compiled=vec.precompile(s_value))
     elif s_type == "range":
-        return Selector(type=s_type, selector=s_value)
+        return Selector(type=s_type, selector=(as_index(s_value[0]), as_index(s_value[1])))  # the span is used for slicing, so the infinities must be ints.
     elif s_type == "llm_prompt" and caller_selector:
-        return Selector(type='regex', selector=caller_selector(s_value))
+        return Selector(type='regex', selector=(s_value := caller_selector(s_value)), compiled=vec.precompile(s_value))
     raise ValueError(f"Unknown selector type: {s_type}")
 
 
-def interpret_target(selector_data: dict[str, Any]) -> Target:
+def interpret_target(selector_data: Term) -> Target:
     """Converts AST selector data into a clean Target NamedTuple."""
-    t_type = selector_data["target_type"]
-    t_value = selector_data["value"]
+    t_type, t_value = selector_data
     if t_type == "literal":
         return Target(
             type=t_type,
-            target=t_value if isinstance(t_value, int) else tuple(Cell(c) for c in t_value)  # this really needs to be a tuple so that vec.Vec is able to cache it properly (tuple is hashable)
+            target=t_value if isinstance(t_value, int) else tuple(map(Cell, t_value))  # this really needs to be a tuple so that vec.Vec is able to cache it properly (tuple is hashable)
         )
     # add more conditionals if additional types are added to the terminal for target
     raise ValueError(f"Unknown target type: {t_type}")
 
 
-def interpret_instructions(instructions: Sequence[dict], global_flags: dict[str, Any], caller_selector: SpecialSelector | None = None) -> Iterator[BaseRule]:
+def interpret_instructions(instructions: Sequence[Instruction], global_flags: dict[str, Any], caller_selector: SpecialSelector | None = None) -> Iterator[BaseRule]:
     """
     Iterates over the flat list of instructions, instantiates the correct
     Rule subclass, merges flags, and initializes fields.
     """
+    rule_mapper: dict[str, Type[BaseRule]] = RULE_MAPPER
+    global_attrs: dict[Type[BaseRule], list[tuple[str, Any]]] = {}  # the global flags resolved to attribute names (once per rule class)
     for instruction in instructions:
-        operator = instruction['operator']['symbol']
-        RuleClass = RULE_MAPPER.get(operator)
+        operator = instruction.operator.symbol
+        RuleClass = rule_mapper.get(operator)
         if not RuleClass:
             print(f"Warning: Unknown operator '{operator}'. Skipping rule.")
             continue
 
         # Prepare Selectors and Targets
-        if not instruction['selector']:
+        if not instruction.selector:
             print(f'Warning: All rules must have a selector. Skipping rule.')
             continue
-        selectors = [interpret_selector(sd, caller_selector) for sd in instruction['selector']]
-        target = [interpret_target(td) for td in instruction['target']]
+        selectors = [interpret_selector(sd, caller_selector) for sd in instruction.selector]
+        target = [interpret_target(td) for td in instruction.target]
 
         # Instantiate Rule
         rule_instance: BaseRule = RuleClass(selectors, target)
 
-        # Merge and Assign Flags (Global < Rule/Group)
+        # Assign Flags (Global < Rule/Group)
+        # Map shorthand keys (e.g., 'pl' for 'parallel_processing_limit') to full attribute names
+        flag_alias: dict[str, str] = RuleClass.FLAG_ALIAS
+        try:
+            attrs = global_attrs[RuleClass]
+        except KeyError:
+            attrs = global_attrs[RuleClass] = [(flag_alias.get(key, key), value) for key, value in global_flags.items()]
         # Start with global defaults
-        final_flags = global_flags.copy()
-        rule_flags = instruction.get('flags', {})
-        final_flags.update(rule_flags)  # Apply rule/group flags (overwrites global)
-        # Apply flags to the rule instance
-        for key, value in final_flags.items():
-            # Map shorthand keys (e.g., 'pl' for 'parallel_processing_limit') to full attribute names
-            setattr(rule_instance, rule_instance.FLAG_ALIAS.get(key, key), value)
+        for attr, value in attrs:
+            setattr(rule_instance, attr, value)
+        # Apply rule/group flags (overwrites global)
+        for key, value in instruction.flags.items():
+            setattr(rule_instance, flag_alias.get(key, key), value)
 
         yield rule_instance
 
 
+def _eval(s: str) -> Any:
+    """Evaluates a directive argument. Literals (the common case) are parsed with literal_eval, anything else falls back to eval()."""
+    try:
+        return literal_eval(s)
+    except (ValueError, SyntaxError):
+        return eval(s)  # yes, I know this is not safe... buts it's very useful.
+
+
 def interpret_directives(objects: dict[str, Any], directives: list[tuple[str, Any]]) -> dict[str, Any]:
     """
     Use the directives to modify (call) the `objects`.
@@ -115,7 +130,7 @@ def interpret_directives(objects: dict[str, Any], directives: list[tuple[str, An
         for arg in args:
             if isinstance(arg, str) and '=' in arg:
                 k, v = arg.split('=')
-                _kwargs[k] = eval(v)  # yes, I know this is not safe... buts it's very useful.
+                _kwargs[k] = _eval(v)
             else:
                 _args.append(arg)
         returns[path] = current_obj(*_args, **_kwargs)
@@ -134,18 +149,6 @@ class FlowLangBase(Flow):
         """Should set the current ruleset and initial space based on interpreted string. Also, handle directives."""
         raise NotImplementedError()
 
-    def undo(self, n_steps: int) -> None:
-        super().undo(n_steps)
-        for space in self.current_event.spaces:  # we must remember to refresh the search buffer if undoing anything...
-            # noinspection PyUnresolvedReferences
-            space.cells.refresh_search_buffer()
-
-    def clear_evolution(self) -> None:
-        super().clear_evolution()
-        for space in self.current_event.spaces:  # we must remember to refresh the search buffer if clearing anything...
-            # noinspection PyUnresolvedReferences
-            space.cells.refresh_search_buffer()
-
 
 class FlowLang(FlowLangBase):
     """The main interpreter object, it is what actually runs any given code."""
@@ -154,7 +157,7 @@ class FlowLang(FlowLangBase):
         self.ast: dict[str, Any] = cast(dict[str, Any], cast(object, FlowLangParser().parse(s)))  # a bunch of stupid casting due to the Lark.parse() hinting at Tree[Token] return instead of what the transformer returns.
         r: dict[str, Any] = interpret_directives(
             {
-                'init': lambda *args: map(eval, map(str, args)),  # used to set the initial universe conditions.
+                'init': lambda *args: map(_eval, map(str, args)),  # used to set the initial universe conditions.
                 # We map str to the args because the parser.py auto-converts number characters (and others) to their actual types... str() converts these back.
                 # I know, I know... eval is unsafe. But in this context, I think it's fine because FlowLang is a language built on top of python. Just be careful if using FlowLang on a deployed server for users to use.
                 'mem': lambda mode: mode,  # used to set the cells container for the SpaceState.
@@ -179,7 +182,7 @@ class FlowLang(FlowLangBase):
         ))
         Vec: type[vec.Vec] = getattr(vec, r.get('mem', vec.Vec.__name__))  # this is the vector we use (vec.Vec is the default)
         if not self.events:
-            self.set_initial_space([SpaceState(Vec([Cell(s) for s in string])) for string in r['init']])
+            self.set_initial_space([SpaceState(Vec.from_string(string)) for string in r['init']])
 
         # after instantiation
         interpret_directives({
@@ -212,14 +215,13 @@ class FlowLang(FlowLangBase):
         for rule in rules:
             if type(rule) != OverwriteRule:  # we only care about this type of rule... for obvious reasons
                 continue
-            rule_is_active: bool = False
-            for target in rule.target:
-                for selector in rule.selector:
-                    for s_char, t_char in zip(selector.selector, target.target):  # we only care about the first/primary target... (we can't determine how multiple targets will behave on different match sets)
-                        if t_char.quanta == '_':
-                            continue
-                        if s_char != t_char.quanta:
-                            rule_is_active = True
+            rule_is_active: bool = any(  # stops at the first character that would change
+                s_char != t_char.quanta
+                for target in rule.target
+                for selector in rule.selector
+                for s_char, t_char in zip(selector.selector, target.target)  # we only care about the first/primary target... (we can't determine how multiple targets will behave on different match sets)
+                if t_char.quanta != '_'
+            )
             if not rule_is_active:
                 rule.disabled = True
 
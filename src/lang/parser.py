@@ -1,7 +1,20 @@
+import re
+from os.path import getmtime
+from copy import deepcopy
+from functools import cache
 from integrations import enumerator
-from lark import Lark, Transformer
+from lark import Lark, Transformer, Token, v_args
+from lark.exceptions import UnexpectedInput
 from core.numlib import str_to_num, INF
-from typing import Any, cast
+from typing import Any, NamedTuple, Literal, cast
+from dataclasses import dataclass
+
+# Attempt to import the (optional) compiled Cython backend for Lark. If it fails, the pure python parser is used.
+try:
+    import lark_cython
+    LARK_CYTHON_AVAILABLE = True
+except ImportError:
+    LARK_CYTHON_AVAILABLE = False
 
 
 GRAMMAR = r"""
@@ -24,16 +37,16 @@ instruction_sequence: (instruction ";")+
 // Core Instruction Definition
 // ------------------------------------------
 
-instruction: [selector*] operator [target*] [flags]
+instruction: [selector*] OPERATOR [target*] [flags]
 
-// --- Selector ---
-selector: regex_term
+// --- Selector --- (`?` inlines these so the term is passed to the instruction directly)
+?selector: regex_term
         | caller_term  // this can be used, for instance, by an LLM to transform text into a specialized selector.
         | range_term
         | literal_term
 
 // --- Target ---
-target: literal_term
+?target: literal_term
 
 // We define these as specific terminals to prevent ambiguity
 regex_term: REGEX_LITERAL
@@ -41,18 +54,8 @@ caller_term: STRING_LITERAL
 range_term: RANGE_LITERAL
 literal_term: SIMPLE_LITERAL
 
-// --- Operators ---
-operator: OP_REVERSE
-        | OP_OVERWRITE
-        | OP_DELETE
-        | OP_SHIFT_R
-        | OP_SHIFT_L
-        | OP_SUB
-        | OP_INSERT
-
 // --- Flags ---
-flags: flag+
-flag: FLAG_DEF
+flags: FLAG_DEF+  // each FLAG_DEF token is parsed directly in the transformer (no intermediate `flag` rule)
 
 // ------------------------------------------
 // Terminals
@@ -63,14 +66,8 @@ REGEX_LITERAL: /\/[^\/]+\//
 STRING_LITERAL: /"[^"]+"/
 RANGE_LITERAL: /\[\s*(?:-?\d+|inf|-inf)?\s*(,\s*(?:-?\d+|inf|-inf)?\s*)?\]/   // Matches [1], [1,2], [1,] or [,2]
 
-// Operators (Longer matches first)
-OP_REVERSE:   ">><<"
-OP_OVERWRITE: "-->"
-OP_DELETE:    "><"
-OP_SHIFT_R:   ">>"
-OP_SHIFT_L:   "<<"
-OP_SUB:       "->"
-OP_INSERT:    ">"
+// Operators (a single terminal is matched by the lexer in one go; longer matches first)
+OPERATOR: ">><<" | "-->" | "><" | ">>" | "<<" | "->" | ">"
 
 // Flags
 FLAG_DEF: /-[a-zA-Z][a-zA-Z0-9_]*(\[[^\]]*\])?/
@@ -98,102 +95,178 @@ directive: "@" DIRECTIVE_KEY "(" [DIRECTIVE_VALUE] ");"
 """
 
 
+# ==== AST Nodes ====
+class Term(NamedTuple):
+    """A selector or target of an instruction (which one depends on which side of the operator it is on)."""
+    type: Literal["literal", "regex", "caller", "range", "int"]
+    value: str | int | tuple[int | float, int | float]
+
+
+class Operator(NamedTuple):
+    type: str  # e.g. 'OP_SUB' (see OPERATOR_TYPES)
+    symbol: str
+
+
+@dataclass(slots=True)  # mutable because the flags of blocks are distributed into the instruction after it is created
+class Instruction:
+    selector: list[Term]
+    operator: Operator
+    target: list[Term]
+    flags: dict[str, Any]
+
+
+OPERATOR_TYPES: dict[str, str] = {  # maps the symbol of an OPERATOR token to its operator type
+    '>><<': 'OP_REVERSE',
+    '-->': 'OP_OVERWRITE',
+    '><': 'OP_DELETE',
+    '>>': 'OP_SHIFT_R',
+    '<<': 'OP_SHIFT_L',
+    '->': 'OP_SUB',
+    '>': 'OP_INSERT',
+}
+OPERATORS: dict[str, Operator] = {symbol: Operator(t, symbol) for symbol, t in OPERATOR_TYPES.items()}  # shared (immutable) nodes
+
+
 BUILTIN_IMPORT_PATHS: dict[str, str] = {
     'ca.fp': "@regex_find_args(overlapped=True);\n"
              "@compress(0);\n"
              "@merge(0);\n"
              "-pl[inf] -mr[0,inf]",  # default import code to streamline the use of CAs in the 0th group.
-    'global_multiway.fp': "@search_buffer(false);\n"  # because the search buffer becomes "corrupt" after edits.
-                          "-gb[false] "  # all rules must be applied (no breaking)
+    'global_multiway.fp': "-gb[false] "  # all rules must be applied (no breaking)
                           "-sr[0, inf] "
                           "-mr[0, inf] "
                           "-bl[inf]",
-    'ordered_multiway.fp': "@search_buffer(false);\n"
-                           "-gb[true] "  # only the first rule (in ordered precedence) that matches is branched out
+    'ordered_multiway.fp': "-gb[true] "  # only the first rule (in ordered precedence) that matches is branched out
                            "-sr[0, inf] "
                            "-mr[0, inf] "
                            "-bl[inf]",
 }
 
 
+_FLAG_RE: re.Pattern = re.compile(r'-([a-zA-Z][a-zA-Z0-9_]*)(?:\[([^\]]*)\])?')  # mirrors the FLAG_DEF terminal
+_flag_cache_size: int = 1024
+_flag_cache: dict[str, tuple[str, Any]] = {}  # raw flag string -> (name, args). Generated instructions repeat the same flags a lot.
+_RANGE_RE: re.Pattern = re.compile(r'\[\s*(-?\d+|inf|-inf)?\s*(,\s*(-?\d+|inf|-inf)?\s*)?\]')  # mirrors RANGE_LITERAL (with the bounds captured)
+_term_cache_size: int = 1024
+_term_cache: dict[str, Term] = {}  # raw token -> Term (terms are immutable, so the same node can be shared between instructions)
+
+
+def parse_part(part: str) -> int | float | str | bool | None:
+    """Converts a single (comma separated) argument of a flag or directive to its python value."""
+    p: str = part.strip()
+    if p == '':
+        return None
+    elif p.lower() == 'true':
+        return True
+    elif p.lower() == 'false':
+        return False
+    try:
+        return str_to_num(p)
+    except ValueError:
+        return p
+
+
+def parse_flag(raw: str) -> tuple[str, Any]:
+    """Parses a raw flag string "-name[args]" into (name, args). The results are cached as the args are immutable."""
+    try:
+        return _flag_cache[raw]
+    except KeyError:
+        name, args_str = _FLAG_RE.fullmatch(raw).groups()
+        if not args_str:  # default value for boolean/unit flags (e.g., -a, -nt, -x[])
+            args: bool | int | float | str | tuple[int | float | str, ...] = True
+        elif ',' not in args_str:
+            args = parse_part(args_str)
+        else:
+            args = tuple(map(parse_part, args_str.split(',')))
+        r: tuple[str, Any] = (name, args)
+        if len(_flag_cache) < _flag_cache_size:
+            _flag_cache[raw] = r
+        return r
+
+
+def _cached_term(raw: str, t: str, value: str) -> Term:
+    try:
+        return _term_cache[raw]
+    except KeyError:
+        term: Term = Term(t, value)
+        if len(_term_cache) < _term_cache_size:
+            _term_cache[raw] = term
+        return term
+
+
 def _r_parse(value: str) -> dict[str, Any]:
     """Recursive parsing helper for top-level directives"""
-    return cast(dict[str, Any], cast(object, FlowLangParser(use_transformer=True).parse(value)))
+    return cast(dict[str, Any], cast(object, FlowLangParser().parse(value)))
 
 
-def import_directive(path: str) -> list[dict[str, Any]]:
-    """Import from a file or preset"""
-    value: str = BUILTIN_IMPORT_PATHS.get(path, None)
-    if value is None:
-        with open(f'{path}.flow') as f:
-            value = f.read()
-    result = _r_parse(value)
-    result['type'] = 'imported'  # we create an "imported" object type.
-    return [result]
+_import_cache: dict[str, tuple[float | None, dict[str, Any]]] = {}  # path -> (mtime of the file or None for presets, parsed result)
 
 
-def decode_directive(method: str, *args) -> list[dict[str, Any]]:
-    """Just use the general functions for rule enumeration and convert that to a string, parse, and return."""
+def import_directive(path: str) -> list[tuple[str, Any]]:
+    """Import from a file or preset (parsed results are cached until the file is modified)"""
+    value: str = BUILTIN_IMPORT_PATHS.get(path, None)
+    mtime: float | None = None if value is not None else getmtime(f'{path}.flow')
+    cached: tuple[float | None, dict[str, Any]] | None = _import_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        if value is None:
+            with open(f'{path}.flow') as f:
+                value = f.read()
+        cached = _import_cache[path] = (mtime, _r_parse(value))
+    return [('imported', deepcopy(cached[1]))]  # we create an "imported" object kind. Copied because the flags (etc.) get mutated downstream.
+
+
+def decode_directive(method: str, *args) -> list[tuple[str, Any]]:
+    """Just use the general functions for rule enumeration and build the instructions directly (no text to parse)."""
     if method == 'wns':
-        src: str = ''.join([
-            f'{selector} --> _{target};'
+        operator: Operator = OPERATORS['-->']
+        return [
+            ('instruction', Instruction([_cached_term(selector, 'literal', selector)], operator,
+                                        [_cached_term(t := f'_{target}', 'literal', t)], {}))  # i.e. `{selector} --> _{target};`
             for selector, target in enumerator.wolfram_numbering_scheme(*args)
-        ])
-        return _r_parse(src)['instructions']
+        ]
     raise ValueError(f'Enumeration method `{method}` is not implemented')
 
 
-def intercept_top_level_directive(d: dict[str, Any]) -> list[dict[str, Any]]:
-    name: str = d['key']
-    if name == 'import':
-        return import_directive(d['value'][0])
-    elif name == 'decode':
-        return decode_directive(*d['value'])
+def intercept_top_level_directive(key: str, value: tuple) -> list[tuple[str, Any]]:
+    if key == 'import':
+        return import_directive(value[0])
+    elif key == 'decode':
+        return decode_directive(*value)
     else:  # if there is nothing to intercept just propagate
-        return [d]
+        return [('directive', (key, value))]
 
 
 class FlowLangTransformer(Transformer):
     """
-    Transforms the Lark AST for Flow Lang into a structured Python dictionary,
+    Transforms the Lark AST for Flow Lang into a structured Python dictionary (of Instruction/Term/Operator nodes),
     handling directives, global flags, rule groups (by distributing flags), and individual instructions.
-    """
 
-    # helper
-    @staticmethod
-    def parse_part(part) -> int | float | str | bool | None:
-        p: str = part.strip()
-        if p == '':
-            return None
-        elif p.lower() == 'true':
-            return True
-        elif p.lower() == 'false':
-            return False
-        try:
-            return str_to_num(p)
-        except ValueError:
-            return p
+    The top-level rules return lists of (kind, payload) tuples which start() dispatches on.
+    """
 
     def start(self, items):
         """
         The root of the file. Collects all top-level elements into a single list
         of instructions and a dictionary of ruleset flags.
         """
-        directives = []
-        global_flags = {}
-        instructions = []
+        directives: list[tuple[str, tuple]] = []
+        global_flags: dict[str, Any] = {}
+        instructions: list[Instruction] = []
+
+        def imported(result: dict[str, Any]) -> None:
+            directives.extend(result['directives'])
+            global_flags.update(result['global_flags'])
+            instructions.extend(result['instructions'])
+
+        handlers = {
+            'directive': directives.append,
+            'global_flags': global_flags.update,
+            'instruction': instructions.append,
+            'imported': imported,
+        }
         for array in items:
-            for item in array:
-                if item['type'] == 'directive':
-                    directives.append((item['key'], item['value']))
-                elif item['type'] == 'global_flags':
-                    global_flags.update(item['flags'])
-                elif item['type'] == 'instruction':
-                    instructions.append(item)
-                elif item['type'] == 'imported':
-                    directives.extend(item['directives'])
-                    global_flags.update(item['global_flags'])
-                    instructions.extend(item['instructions'])
+            for kind, payload in array:
+                handlers[kind](payload)
         return {
             'directives': directives,
             'global_flags': global_flags,  # the flags the set the defaults
@@ -202,144 +275,100 @@ class FlowLangTransformer(Transformer):
 
     def directive(self, items):
         if items[1]:  # detect None for directives such as `@Test.me()` with no arguments
-            value: tuple = tuple((self.parse_part(p) for p in items[1].value.split(',')))  # parse the args
+            value: tuple = tuple(map(parse_part, items[1].value.split(',')))  # parse the args
         else:
             value: tuple = ()
-        return intercept_top_level_directive({
-            'type': 'directive',
-            'key': items[0].value,
-            'value': value
-        })
+        return intercept_top_level_directive(items[0].value, value)
 
     def global_flags(self, items):
-        return [{'type': 'global_flags', 'flags': items[0]}]  # we wrap in a list so that the start() visitor can do less work
+        return [('global_flags', items[0])]  # we wrap in a list so that the start() visitor can do less work
 
     def block(self, items):
         flags = items[0]  # temp
-        instructions = items[1]
-        for instruction in instructions:  # distribute the flags of the block into its constituents
-            for k, v in flags.items():
-                instruction['flags'].setdefault(k, v)
-        return instructions
+        out = []
+        for array in items[1:]:  # the instruction sequences and (rule generating) directives of the block
+            for kind, payload in array:
+                if kind == 'instruction':  # distribute the flags of the block into its constituents (the instruction's own flags win)
+                    payload.flags = flags | payload.flags
+                out.append((kind, payload))
+        return out
 
     def instruction_sequence(self, items):
-        return items
+        return [('instruction', instruction) for instruction in items]
 
     def instruction(self, items):
-        out = {
-            "type": 'instruction',
-            "selector": [],
-            "operator": None,
-            "target": [],
-            "flags": _ if (_:=items[-1]) else {}
-        }
-        for i in range(len(items) - 1):  # -1 to prevent looping over the flags dict (or None if there are no flags)
-            t: str = items[i]['type']
-            if t == 'selector':
-                out['selector'].append(items[i])
-            elif t == 'operator':
-                out['operator'] = items[i]
-            elif t == 'target':
-                out['target'].append(items[i])
-        if (op_type:=out['operator']['operator_type']) in ('OP_SHIFT_R', 'OP_SHIFT_L'):  # special case for these rules
-            for t in out['target']:
-                t: dict  # to make the IDE recognize it
-                t['value'] = str_to_num(t['value']) * (-1 if op_type == 'OP_SHIFT_L' else 1)
-                t['target_type'] = 'int'
-        return out
-
-    def selector(self, items):
-        # Unwrap selector child (regex_term, literal_term, etc.)
-        items[0]['selector_type'] = items[0]['type']
-        items[0]['type'] = 'selector'
-        return items[0]
-
-    def target(self, items):
-        items[0]['target_type'] = items[0]['type']
-        items[0]['type'] = 'target'
-        return items[0]
-
-    def operator(self, items):
-        # Unwrap operator
-        return {
-            "type": 'operator',
-            "operator_type": items[0].type,
-            "symbol": items[0].value
-        }
-
-    # --- Terminals to Values (Unchanged) ---
-    def regex_term(self, items):
-        return {"type": "regex", "value": items[0].value[1:-1]}
-
-    def literal_term(self, items):
-        return {"type": "literal", "value": items[0].value}
-
-    def caller_term(self, items):
-        return {"type": "caller", "value": items[0].value[1:-1]}
-
-    def range_term(self, items):
-        # Parse [x,y] or [x]
-        content = items[0].value[1:-1]  # strip []
-
-        # Helper to convert part to int or None
-        def parse_part(part):
-            p = part.strip()
-            # Lark returns empty strings for missing parts like in [,2]
-            return str_to_num(p) if p else None
-
-        parts = content.split(',')
-        if len(parts) == 1:
-            start = parse_part(parts[0])
+        flags: dict[str, Any] | None = items.pop()  # (None if there are no flags)
+        i: int = 0
+        while type(items[i]) is not Operator:  # everything before the operator is a selector, everything after a target
+            i += 1
+        operator: Operator = items[i]
+        target: list[Term] = items[i + 1:]
+        if operator.type in ('OP_SHIFT_R', 'OP_SHIFT_L'):  # special case for these rules
+            sign: int = -1 if operator.type == 'OP_SHIFT_L' else 1
+            target = [Term('int', str_to_num(t.value) * sign) for t in target]
+        return Instruction(items[:i], operator, target, flags if flags else {})
+
+    def OPERATOR(self, token: Token) -> Operator:  # terminal callback (there is no wrapping rule for the operator)
+        return OPERATORS[token.value]
+
+    # --- Terminals to Values ---
+    @v_args(inline=True)
+    def regex_term(self, token: Token) -> Term:
+        return _cached_term(token.value, "regex", token.value[1:-1])
+
+    @v_args(inline=True)
+    def literal_term(self, token: Token) -> Term:
+        return _cached_term(token.value, "literal", token.value)
+
+    @v_args(inline=True)
+    def caller_term(self, token: Token) -> Term:
+        return _cached_term(token.value, "caller", token.value[1:-1])
+
+    @v_args(inline=True)
+    def range_term(self, token: Token) -> Term:
+        # Parse [x,y] or [x] (the same few ranges, such as [0,inf], tend to repeat so they are cached)
+        try:
+            return _term_cache[token.value]
+        except KeyError:
+            pass
+        start, comma, end = _RANGE_RE.fullmatch(token.value).groups()  # missing bounds are None like in [,2]
+        start = str_to_num(start) if start else None
+        if comma is None:
             end = start
-        else:  # this will be the case: len(parts) == 2
-            start = parse_part(parts[0])
-            end = parse_part(parts[1])
+        else:
+            end = str_to_num(end) if end else INF
             if start is None: start = 0
-            if end is None: end = INF
-
-        return {"type": "range", "value": (start, end)}
+        return _cached_term(token.value, "range", (start, end))
 
     # --- Flags ---
     def flags(self, items):
         """
-        Collects all individual flag dictionaries into a single dictionary
+        Collects all FLAG_DEF tokens into a single dictionary
         that can be merged into a rule, group header, or ruleset.
         """
-        flag_dict = {}
-        for f in items:
-            # f is a dictionary like {'flag_name': value} returned by self.flag
-            flag_dict.update(f)
-        return flag_dict
-
-    def flag(self, items):
-        # Parse the raw flag string "-name[args]"
-        raw = items[0].value
-        # Remove leading "-"
-        raw = raw[1:]
-
-        # Default value for boolean/unit flags (e.g., -a, -nt)
-        args: bool = True
-        name = raw
-
-        if '[' in raw and raw.endswith(']'):
-            name_part, args_part = raw.split('[', 1)
-            name = name_part
-            args_str = args_part[:-1]  # remove trailing "]"
-            if args_str:
-                arg_parts = args_str.split(',')
-                if len(arg_parts) == 1:
-                    args: int | float | str = self.parse_part(arg_parts[0])
-                else:
-                    args: tuple[int | float | str, ...] = tuple((self.parse_part(p) for p in arg_parts))
-
-        return {name: args}
-
-
-def FlowLangParser(use_transformer: bool = True) -> Lark:
-    """Creates the Lark parser object from which .parse(text) can be called."""
-    return Lark(
+        return dict(parse_flag(token.value) for token in items)
+
+
+class _CompiledLark(Lark):
+    """Lark running the compiled lark_cython lexer/parser loop.
+    The parse errors it raises cannot be converted to strings (they reference the Cython parser state), so a failed parse
+    is re-run with the pure python parser to raise an error that can be reported."""
+    def parse(self, text, start=None, on_error=None):
+        try:
+            return super().parse(text, start, on_error)
+        except UnexpectedInput:
+            pass  # re-parsed outside the except block so that the unprintable error is not chained to the new one
+        return FlowLangParser(self.options.transformer is not None, False).parse(text, start, on_error)
+
+
+@cache  # the parser (and transformer) is stateless between parses, so one shared instance per mode is enough
+def FlowLangParser(use_transformer: bool = True, compiled: bool = LARK_CYTHON_AVAILABLE) -> Lark:
+    """Creates (once) the Lark parser object from which .parse(text) can be called."""
+    return (_CompiledLark if compiled else Lark)(
         grammar=GRAMMAR,
         parser='lalr',
+        cache=True,  # pickles the LALR tables to a temp file (keyed on the grammar) so they are only built once
+        _plugins=lark_cython.plugins if compiled else {},  # compiled lexer/parser loop (same interface)
         transformer=FlowLangTransformer() if use_transformer else None
     )
 
@@ -1,8 +1,8 @@
 from core.engine import SpaceState1D, Cell
 def space(string: str) -> SpaceState1D:
-    return SpaceState1D([Cell(s) for s in string])
+    return SpaceState1D(Cell.from_string(string))
 def seq(string: str) -> list[Cell]:
-    return [Cell(s) for s in string]
+    return Cell.from_string(string)
 s = space('ABBABBAabc123xyz456abc')
 
 
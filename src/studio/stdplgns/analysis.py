@@ -12,7 +12,7 @@ from textual.widgets.selection_list import Selection
 from typing import Iterator
 from studio.model import Plugin
 from core.graph import EventCausalityGraph
-from core.numlib import str_to_num, INF
+from core.numlib import str_to_num, INF, as_index
 from studio.config import USER_DATA_DIR_PATH
 from pyvis.network import Network
 import networkx as nx
@@ -294,7 +294,7 @@ class P(Plugin):
         causal_distance_data: list[int] = []
         connected_abs_distance_data: list[int] = []
         connected_set_distance_data: list[int] = []
-        for event in self.model.flow.events[a:b+(1 if b > 0 else 0):c]:
+        for event in self.model.flow.events[a:as_index(b+(1 if b > 0 else 0)):c]:
             causal_distance_data.append(event.causal_distance_to_creation)
             connected_abs_distance_data.append(len(_:=tuple(event.causally_connected_events)))
             connected_set_distance_data.append(len(set(_)))
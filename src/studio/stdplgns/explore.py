@@ -3,8 +3,8 @@ This plugin provides an exploratory environment for the evolutions of cellular s
 """
 # Textual Imports
 from rich.text import Text
-from textual.widgets import (Collapsible, TabPane, Input, Select,
-                             Checkbox, Label, DataTable as _DataTable, SelectionList, ContentSwitcher)
+from textual.widgets import (Collapsible, TabPane, Input,
+                             Checkbox, Label, DataTable as _DataTable, SelectionList)
 from textual.widgets.data_table import CellKey
 from textual.widget import Widget
 from textual.coordinate import Coordinate
@@ -13,8 +13,8 @@ from textual.containers import VerticalScroll, Horizontal, Vertical
 from textual.events import MouseMove
 
 # Standard Imports
-from typing import Iterator, Sequence, cast
-from core.numlib import INF, str_to_num, is_infinity
+from typing import Iterator, Sequence
+from core.numlib import INF, str_to_num, is_infinity, as_index
 from core.engine import Event as FlowEvent, SpaceState, Cell as FlowCell, DeltaCell, DeltaSpace, DeltaSpaces
 from core.prettier import SpaceStateStringFormatter
 from core.signals import Signal
@@ -523,7 +523,7 @@ class P(Plugin):
         dt = self.data_table
         old_x, old_y = dt.scroll_x, dt.scroll_y
         dt.clear()
-        for event in self.model.flow.events[a:b + (1 if b > 0 else 0):c]:
+        for event in self.model.flow.events[a:as_index(b + (1 if b > 0 else 0)):c]:
             self._add_row(event)
         self._refresh_column_widths()
         dt.scroll_to(x=old_x, y=old_y, animate=False)
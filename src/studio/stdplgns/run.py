@@ -4,7 +4,7 @@ This plugin provides basic running/undoing features, hot-reload, and several oth
 # Textual Imports
 from textual.widgets import Collapsible, TabPane, Input, Checkbox, Button, ProgressBar, Label, RichLog
 from textual.widget import Widget
-from textual.containers import ScrollableContainer, Horizontal
+from textual.containers import ScrollableContainer
 from textual.timer import Timer
 
 # Standard Imports
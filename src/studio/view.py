@@ -15,6 +15,7 @@ from typing import cast, Iterable
 from textual.app import App, ComposeResult
 from textual.containers import Container, Center, Horizontal, Vertical, ScrollableContainer
 from textual.screen import Screen, ModalScreen
+from textual.widget import Widget
 from textual.widgets import (
     DirectoryTree as _DirectoryTree, TextArea as _TextArea, Button, Label,
     Select, TabbedContent, OptionList, Input, SelectionList,
@@ -193,18 +194,25 @@ class WelcomeScreen(Screen):
             wc.border_subtitle = config.VERSION
             with Center():  # to center it *relative* to the other widgets
                 yield Label(LOGO, id="welcome-title")
-            yield (
-                _:=OptionList(id="recents-list")
-            )
-            _.border_title = 'Recent Projects'
-            for k, v in config.RecentProjects.list().items():
-                _.add_option(Option(f'{k} [grey]({v})[/grey]', k))
+            self.recents_list: OptionList = OptionList(id="recents-list")
+            self.recents_list.border_title = 'Recent Projects'
+            yield self.recents_list
             with Horizontal(id="welcome-buttons"):
                 yield Button("📂 Open", id="btn-open-project", variant="primary")
                 yield Button("➕ New", id="btn-new-project", variant="default")
                 yield Spacer()
                 yield Button("🗑  Forget", id="btn-remove-recent", variant="default")
 
+    def on_mount(self) -> None:
+        # fill the recents after the first paint (the OptionList only renders the visible lines itself)
+        self.call_after_refresh(self.load_recents)
+
+    def load_recents(self) -> None:
+        """Adds all the recent projects to the list in one batch (rather than one add_option() at a time)."""
+        self.recents_list.add_options(
+            Option(f'{k} [grey]({v})[/grey]', k) for k, v in config.RecentProjects.list().items()
+        )
+
     @on(Button.Pressed, "#btn-new-project")
     def btn_new_project(self):
         """Calls the UniversalModal to get a new project path."""
@@ -222,8 +230,7 @@ class WelcomeScreen(Screen):
                 self.notify('Please enter a valid path to a directory.', severity='error')
                 return
             try:
-                # noinspection PyUnresolvedReferences
-                self.query_one("#recents-list").add_option(Option(f'{name} [grey]({path})[/grey]', name))
+                self.recents_list.add_option(Option(f'{name} [grey]({path})[/grey]', name))
                 config.RecentProjects.add(name, path)
                 self.notify(f"Loaded project at: {path}")
             except DuplicateIDError:
@@ -256,7 +263,7 @@ class WelcomeScreen(Screen):
 
     @on(Button.Pressed, "#btn-open-project")
     def btn_open_project(self):
-        _: OptionList = cast(OptionList, self.query_one("#recents-list"))
+        _: OptionList = self.recents_list
         if i:=_.highlighted_option:
             self.dismiss(
                 {
@@ -269,7 +276,7 @@ class WelcomeScreen(Screen):
 
     @on(Button.Pressed, "#btn-remove-recent")
     def btn_remove_recent(self):
-        _: OptionList = cast(OptionList, self.query_one("#recents-list"))
+        _: OptionList = self.recents_list
         if i:=_.highlighted_option:
             _.remove_option(i.id)
             config.RecentProjects.remove(i.id)
@@ -295,9 +302,12 @@ class EditorScreen(Screen):
 
     def compose(self) -> ComposeResult:
         # --- LEFT COLUMN: Project Files ---
-        with Vertical(id="project-directory"):
+        # NOTE: the widgets that the actions/handlers touch are kept as attributes (rather than re-queried from the DOM each time)
+        self.project_directory: Vertical = Vertical(id="project-directory")
+        with self.project_directory:
             yield Label(f"⭘ {self.app.MODEL.project_name}", id="project-title-label", classes="pane-header")
-            yield DirectoryTree(self.app.MODEL.project_path, id="project-dir-tree")
+            self.project_dir_tree: DirectoryTree = DirectoryTree(self.app.MODEL.project_path, id="project-dir-tree")
+            yield self.project_dir_tree
             yield Button('↻  Refresh Directory', id='btn_refresh_project_dir', classes='full-width gray')
 
         # --- MIDDLE COLUMN: Workspace ---
@@ -307,7 +317,8 @@ class EditorScreen(Screen):
                 self.open_file_label = Label("No Open File", classes='gray')
                 yield self.open_file_label
                 yield Spacer()
-                yield Button("Run", id="btn-run", classes="action-btn green", compact=True)
+                self.run_button: Button = Button("Run", id="btn-run", classes="action-btn green", compact=True)
+                yield self.run_button
                 yield Label("| ", classes="gray")
                 yield Button("Undo", id="btn-undo", classes="action-btn orange", compact=True)
                 yield Label("| ", classes="gray")
@@ -323,16 +334,20 @@ class EditorScreen(Screen):
             # _.register_language()
 
             # Plugin Panel
-            with TabbedContent(id="plugin-panel"):
+            self.plugin_panel: TabbedContent = TabbedContent(id="plugin-panel")
+            with self.plugin_panel:
                 # loop through the plugin TabPanes and yield them here
                 for plugin in self.app.MODEL.plugins:
                     if _:=plugin.panel():
                         yield _
 
         # --- RIGHT COLUMN: Plugin Control Menu ---
-        with Vertical(id="plugin-controls"):
-            yield Label("", classes="pane-header", id="plugin-controls-header")
-            with ContentSwitcher(id="sidebar-switcher"):
+        self.plugin_controls: Vertical = Vertical(id="plugin-controls")
+        with self.plugin_controls:
+            self.plugin_controls_header: Label = Label("", classes="pane-header", id="plugin-controls-header")
+            yield self.plugin_controls_header
+            self.sidebar_switcher: ContentSwitcher = ContentSwitcher(id="sidebar-switcher")
+            with self.sidebar_switcher:
                 # loop through the collapsable's that the plugin provides, and place in Vertical containers.
                 for i, plugin in enumerate(self.app.MODEL.plugins):
                     with ScrollableContainer(id=f'tab-{i+1}'):
@@ -345,17 +360,16 @@ class EditorScreen(Screen):
     # ==== Panel and Controls ====
     def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated):
         """Dynamically switches the Right Sidebar content AND Title."""
-        container: ContentSwitcher = self.query_one('#sidebar-switcher')
-        container.current = event.pane.id
+        self.sidebar_switcher.current = event.pane.id
         # noinspection PyProtectedMember
-        self.query_one('#plugin-controls-header').content = f"⭘ {event.pane._title}"
+        self.plugin_controls_header.content = f"⭘ {event.pane._title}"
 
     # ==== File Manager ====
     def on_directory_tree_file_selected(self, event: DirectoryTree.FileSelected):
         m: model.Model = self.app.MODEL
         if not event.path.exists():
             self.notify("That file no longer exists!", severity="error")
-            self.query_one(DirectoryTree).reload()
+            self.project_dir_tree.reload()
             return
         self.action_save_file()
         m.open_file(event.path)
@@ -364,34 +378,41 @@ class EditorScreen(Screen):
 
     @on(Button.Pressed, '#btn_refresh_project_dir')
     def btn_refresh_project_dir(self):
-        self.query_one(DirectoryTree).reload()
+        self.project_dir_tree.reload()
         self.notify(f"Refreshed Project Directory...")
 
     # ==== Action Handlers ====
     def action_run(self):
         """Action to press the run button upon this action..."""
-        self.query_one('#btn-run').press()
+        self.run_button.press()
 
     def action_save_file(self):
         m: model.Model = self.app.MODEL
         if m.write_file(self.code_editor_text_area.text):
             self.notify(f"Saved the \"{m.flow_path.name}\" file.")
 
+    def _toggle_display(self, widget: Widget):
+        """Queues a display flip so that repeated presses before the next refresh settle in a single layout pass."""
+        if not self._pending_toggles:
+            self.call_after_refresh(self._flush_toggles)
+        self._pending_toggles ^= {widget}  # an even number of presses cancels out
+
+    def _flush_toggles(self):
+        for widget in self._pending_toggles:
+            widget.display = not widget.display
+        self._pending_toggles.clear()
+
     def action_toggle_left_sidebar(self):
-        sidebar = self.query_one("#project-directory")
-        sidebar.display = not sidebar.display
+        self._toggle_display(self.project_directory)
 
     def action_toggle_right_sidebar(self):
-        menu = self.query_one("#plugin-controls")
-        menu.display = not menu.display
+        self._toggle_display(self.plugin_controls)
 
     def action_toggle_bottom_panel(self):
-        panel = self.query_one("#plugin-panel")
-        panel.display = not panel.display
+        self._toggle_display(self.plugin_panel)
 
     def action_toggle_code_editor(self):
-        panel = self.query_one("#code-editor")
-        panel.display = not panel.display
+        self._toggle_display(self.code_editor_text_area)
 
     def action_toggle_max(self):
         if not self.focused:  # if nothing is focused
@@ -404,6 +425,7 @@ class EditorScreen(Screen):
     # ==== Initial Setup and Signal Connections ====
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._pending_toggles: set[Widget] = set()  # widgets whose display is flipped on the next refresh (see _toggle_display)
 
         # ==== Signals ====
         self.sig_button_pressed: Signal[Button.Pressed] = Signal()
@@ -441,15 +463,17 @@ class EditorScreen(Screen):
 
 class Main(App):
     CSS_PATH = "styles.tcss"
+    SCREENS = {"welcome": WelcomeScreen, "editor": EditorScreen}  # factories: each screen is only constructed when first used
+    _editor_screen: EditorScreen | None = None
 
     @property
     def editor_screen(self) -> EditorScreen:
-        return cast(EditorScreen, self.get_screen('editor'))
+        if self._editor_screen is None:  # keep a direct reference (rather than a lookup in the installed screens)
+            self._editor_screen = cast(EditorScreen, self.get_screen('editor'))
+        return self._editor_screen
 
     def on_mount(self):
-        # create the screens and push the welcome page
-        self.install_screen(WelcomeScreen(), name="welcome")
-        self.install_screen(EditorScreen(), name="editor")
+        # push the welcome page (the editor screen is created once a project is opened)
         def on_project_opened(result: dict):
             self.MODEL = model.Model(
                 result["project_name"],
@@ -0,0 +1,40 @@
+import unittest
+from src.implementations.sss import SSS, ReplacementRule, SpaceState, Cell
+from src.core.vec import Vec, TrieVec
+
+
+class TestReplacementRule(unittest.TestCase):
+    def test_non_latin1_selector(self):
+        """Selectors outside latin-1 cannot be searched for in the byte buffer, so they must use the generic find."""
+        rule = ReplacementRule("β -> α")
+        self.assertIsNone(rule.selector_key)
+        space = SpaceState(Cell.from_string("αβα"))
+        matches = rule.match([space])
+        self.assertEqual(matches[0].matches, ((1, 2),))
+        self.assertEqual(str(rule.apply(matches)[0].output_space[0]), "ααα")
+
+    def test_latin1_selector(self):
+        self.assertEqual(ReplacementRule("AB -> B").selector_key, b"AB")
+        self.assertIsNone(ReplacementRule("A.B -> B").selector_key)
+
+
+
+class TestSSS(unittest.TestCase):
+    def test_evolution(self):
+        for mem in (Vec, TrieVec):
+            sss = SSS(["ABA -> AAB", "A -> ABA"], "AB", mem)
+            sss.evolve(4)
+            self.assertEqual([str(s) for e in sss.events for s in e.spaces], ["AB", "ABAB", "AABB", "ABAABB", "AABABB"])
+
+    def test_non_latin1_alphabet(self):
+        """Alphabets outside latin-1 cannot use the byte search buffer, but must evolve the same way."""
+        sss = SSS(["α -> αβ", "β -> α"], "α")
+        sss.evolve(3)
+        self.assertEqual([str(s) for e in sss.events for s in e.spaces], ["α", "αβ", "αββ", "αβββ"])
+        sss = SSS(["A -> A😀"], "A")  # only the target is outside latin-1
+        sss.evolve(2)
+        self.assertEqual(str(next(sss.current_event.spaces)), "A😀😀")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from src.lang import FlowLang
+from src.lang.interpreter import vec
+
+
+def evolve(code: str, n_steps: int) -> FlowLang:
+    flow = FlowLang()
+    flow.interpret(code)
+    flow.evolve(n_steps)
+    return flow
+
+
+def history(flow: FlowLang) -> list[tuple[list[str], list[int]]]:
+    """The (sorted) spaces and causal connections of every event."""
+    return [(sorted(str(s) for s in e.spaces), sorted(e.causally_connected_events)) for e in flow.events]
+
+
+class TestMultiway(unittest.TestCase):
+    PROGRAMS = (
+        ('@import(global_multiway.fp);\n@init("AB");\nA -> AB;\nB -> A;', 5),
+        ('@import(global_multiway.fp);\n@mem(TrieVec);\n@init("ABC");\nA -> AB;\nBC -> C;\nC --> A;', 5),
+        ('@import(ordered_multiway.fp);\n@init("ABA");\nA -> AB;\nB -> BA;', 5),
+    )
+
+    def tearDown(self):
+        vec.enable_search_buffer(True)  # the directive is global
+
+    def test_search_buffer_enabled(self):
+        """Branched spaces share their search buffers copy-on-write, so multiways must evolve the same with the buffer enabled."""
+        for code, n_steps in self.PROGRAMS:
+            expected = history(evolve('@search_buffer(false);\n' + code, n_steps))
+            vec.enable_search_buffer(True)
+            flow = evolve(code, n_steps)
+            self.assertEqual(history(flow), expected)
+            for event in flow.events:  # every (branched) space must keep a search buffer that matches its cells
+                for space in event.spaces:
+                    self.assertEqual(space.cells.search_buffer.decode('latin-1'), str(space))
+
+
+
+class TestProbabilisticFlags(unittest.TestCase):
+    def test_p_apply_zero(self):
+        """A rule that never applies must not use up its lifespan."""
+        flow = evolve('@init("AB");\nA -> AB -p_apply[0] -life[1];', 5)
+        self.assertEqual(history(flow), [(["AB"], [])])
+        rule = flow.ruleset.rules[0]
+        self.assertEqual(rule.lifespan, 1)
+        self.assertFalse(rule.disabled)
+
+    def test_p_apply_one(self):
+        """A rule that always applies must evolve like a rule without the flag."""
+        self.assertEqual(
+            history(evolve('@init("AB");\nA -> AB -p_apply[1];\nB -> BA;', 8)),
+            history(evolve('@init("AB");\nA -> AB;\nB -> BA;', 8))
+        )
+
+    def test_p_seed_reproducible(self):
+        """The same seeds must give the same evolution."""
+        code = '@init("AB");\nA -> AB -p_apply[0.5] -p_seed[7];\nB -> BA -p_apply[0.5] -p_seed[3];'
+        self.assertEqual(history(evolve(code, 12)), history(evolve(code, 12)))
+
+
+if __name__ == '__main__':
+    unittest.main()
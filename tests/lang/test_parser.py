@@ -0,0 +1,29 @@
+import unittest
+from lark.exceptions import UnexpectedInput
+from src.lang.parser import FlowLangParser, LARK_CYTHON_AVAILABLE
+
+
+class TestFlowLangParser(unittest.TestCase):
+    def test_syntax_error_renders(self):
+        """A syntax error must be convertible to a string (the studio reports it), with or without lark_cython."""
+        for use_transformer in (True, False):
+            with self.assertRaises(UnexpectedInput) as ctx:
+                FlowLangParser(use_transformer).parse("A -> ;;; ((")
+            self.assertIn("line 1", str(ctx.exception))
+
+    @unittest.skipUnless(LARK_CYTHON_AVAILABLE, "lark_cython is not installed")
+    def test_compiled_parser(self):
+        """The lark_cython parser must give the same trees as the pure python one and raise errors that render."""
+        program = '@init("AB");\nABA -> AAB -l[2];\n(-g[0]) {A -> ABA;}'
+        self.assertEqual(FlowLangParser(False, True).parse(program), FlowLangParser(False, False).parse(program))
+        with self.assertRaises(UnexpectedInput) as ctx:
+            FlowLangParser(False, True).parse("A -> ;;; ((")
+        self.assertIn("line 1", str(ctx.exception))
+
+    def test_valid_program_parses(self):
+        tree = FlowLangParser(False).parse("A -> B;")
+        self.assertEqual(tree.data, "start")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from src.core.vec import TrieVec, Vec, Cell
+from src.core.vec import TrieVec, Vec, Cell, precompile, LiteralPattern
 
 
 class TestTrieVec(unittest.TestCase):
@@ -15,6 +15,22 @@ class TestTrieVec(unittest.TestCase):
         self.assertEqual(self.vec.search_buffer, bytearray(b"ABCDE"))
         self.assertEqual(self.vec[0].quanta, "A")
 
+    def test_from_string(self):
+        """from_string must build the same state as constructing from cells."""
+        v = TrieVec.from_string(self.initial_chars)
+        self.assertEqual(v.search_buffer, self.vec.search_buffer)
+        self.assertEqual(list(v), list(self.vec))
+        self.assertIsNone(v.evolver)
+        v[0] = Cell("X")
+        self.assertEqual(v.search_buffer, bytearray(b"XBCDE"))
+
+    def test_multi_character_quanta_rejected(self):
+        """A multi-character quanta would misalign the search buffer with the cells."""
+        with self.assertRaises(TypeError):
+            TrieVec([Cell("A"), Cell("BC")])
+        with self.assertRaises(TypeError):
+            self.vec[1:2] = (Cell("XY"),)
+
     def test_point_update_int(self):
         """Test __setitem__ with integer index (triggers evolver)."""
         new_cell = Cell("X")
@@ -82,6 +98,8 @@ class TestTrieVec(unittest.TestCase):
         # Modify original, should not affect branch pvec
         self.vec[1] = Cell("Q")
         self.assertEqual(new_vec[1].quanta, "B")  # Original branch preserved
+        self.assertEqual(new_vec.search_buffer, bytearray(b"ZBCDE"))  # the shared buffer is copied on write
+        self.assertEqual(self.vec.search_buffer, bytearray(b"ZQCDE"))
 
     def test_finditer_pattern_matching(self):
         """Test regex pattern matching via finditer on the search buffer."""
@@ -127,6 +145,19 @@ class TestListVec(unittest.TestCase):
         self.assertEqual(self.vec.search_buffer, bytearray(b"ABCDE"))
         self.assertEqual(self.vec[0].quanta, "A")
 
+    def test_from_string(self):
+        """from_string must build the same state as constructing from cells."""
+        v = Vec.from_string(self.initial_chars)
+        self.assertEqual(v.search_buffer, self.vec.search_buffer)
+        self.assertEqual(list(v), list(self.vec))
+
+    def test_multi_character_quanta_rejected(self):
+        """A multi-character quanta would misalign the search buffer with the cells."""
+        with self.assertRaises(TypeError):
+            Vec([Cell("A"), Cell("BC")])
+        with self.assertRaises(TypeError):
+            self.vec.extend([Cell("XY")])
+
     def test_point_update_int(self):
         """Test __setitem__ with integer index."""
         new_cell = Cell("X")
@@ -179,8 +210,8 @@ class TestListVec(unittest.TestCase):
         # Branch it (creates shallow list copy)
         new_vec = self.vec.branch()
 
-        # Note: Vec.branch() shares the same search_buffer object unless branched explicitly
-        self.assertEqual(new_vec.search_buffer, self.vec.search_buffer)
+        # Note: Vec.branch() shares the same search_buffer object until either side is modified (copy-on-write)
+        self.assertIs(new_vec.search_buffer, self.vec.search_buffer)
 
         # Modify branch list
         new_vec[1] = Cell("Q")
@@ -188,6 +219,8 @@ class TestListVec(unittest.TestCase):
         # Because Vec.branch() uses a shallow copy of the list, index 1 is now distinct.
         self.assertEqual(self.vec[1].quanta, "B")
         self.assertEqual(new_vec[1].quanta, "Q")
+        self.assertEqual(self.vec.search_buffer, bytearray(b"ZBCDE"))
+        self.assertEqual(new_vec.search_buffer, bytearray(b"ZQCDE"))
 
     def test_finditer_pattern_matching(self):
         """Test regex pattern matching via finditer on the search buffer."""
@@ -214,6 +247,20 @@ class TestListVec(unittest.TestCase):
         self.assertEqual(len(xyb_matches), 1)
         self.assertEqual(xyb_matches[0][0], 2)
 
+    def test_finditer_precompiled_pattern(self):
+        """A pattern compiled ahead of time must match the same as its source."""
+        self.vec = Vec([Cell(c) for c in "ABABA"])
+        self.assertEqual(list(self.vec.finditer(precompile("B.B"))), list(self.vec.finditer("B.B")))
+        self.assertEqual(list(self.vec.finditer(precompile(b"BA"))), [(1, 3), (3, 5)])
+
+    def test_finditer_literal_pattern(self):
+        """A literal pattern is scanned without the regex engine but must give the same non-overlapping spans."""
+        self.vec = Vec([Cell(c) for c in "ABABABA"])
+        self.assertIsInstance(precompile("ABA"), LiteralPattern)
+        self.assertNotIsInstance(precompile("A.A"), LiteralPattern)
+        self.assertEqual(list(self.vec.finditer(precompile("ABA"))), [(0, 3), (4, 7)])
+        self.assertEqual(list(self.vec.finditer(precompile("ABA"))), list(self.vec.finditer("ABA")))
+
 
 if __name__ == '__main__':
     unittest.main()